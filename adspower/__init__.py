@@ -1,5 +1,38 @@
-from .adspower import *
+from .errors import (
+    NoRecordedResponse,
+    OperationTimeout,
+    ProfileLimitReached,
+    TooManyRequests,
+    UnableToConnect,
+    UnableToSetProxy,
+    UnableToStartBrowser,
+    UnableToStopBrowser,
+    UnexpectedError,
+)
+
+# Submodules are imported on first attribute access (PEP 562), so that
+# `import adspower` does not pay for `requests` and the models up front.
+_lazy = {
+    "AdsPower": ".adspower",
+    "Browser": ".models",
+    "FingerprintConfig": ".models",
+    "GroupInfo": ".models",
+    "ProfileInfo": ".models",
+    "ProxyConfig": ".models",
+}
 
 __all__ = [
     "AdsPower"    
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _lazy.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
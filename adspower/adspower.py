@@ -1,17 +1,39 @@
+from __future__ import annotations
+
+import threading
 import time
-import requests
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from .consts import BASE_URL
+from .deadline import remaining
+from .errors import OperationTimeout, UnableToConnect, raise_for_response
+
+# Heavy imports are deferred to first use so that `import adspower` stays
+# cheap for short-lived workers, see `adspower.oneshot` for the fastest path.
+if TYPE_CHECKING:
+    import requests
+
+    from .models import Browser, GroupInfo, ProfileInfo, ProxyConfig, FingerprintConfig
+    from .replay import Recorder
 
-from .errors import (
-    ProfileLimitReached,
-    TooManyRequests,
-    UnableToSetProxy,
-    UnableToStartBrowser,
-    UnableToStopBrowser,
-    UnexpectedError,
-)
-from .models import Browser, GroupInfo, ProfileInfo, ProxyConfig, FingerprintConfig
+
+def _read_body(raw) -> bytes:
+    # `timeout` only bounds each socket operation, so the body is read in
+    # chunks and the deadline is checked before waiting for more of it. A
+    # body which has fully arrived is never discarded.
+    # read1 returns whatever has arrived, older urllib3 only has read.
+    read = getattr(raw, "read1", raw.read)
+
+    chunks = []
+    while raw.length_remaining != 0:
+        remaining()
+        chunk = read(16384, decode_content=True)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    return b"".join(chunks)
 
 
 class AdsPower:
@@ -23,8 +45,31 @@ class AdsPower:
     profiles: Dict[str, ProfileInfo]
     groups: Dict[str, GroupInfo]
 
-    def __init__(self):
-        self.base_url = "http://local.adspower.net:50325/api/v1"
+    transport: Optional[Any]
+    recorder: Optional[Recorder]
+    request_delay: float
+    timeout: float
+
+    def __init__(
+        self,
+        transport: Optional[Any] = None,
+        recorder: Optional[Recorder] = None,
+        request_delay: float = 1,
+        timeout: float = 30,
+        base_url: str = BASE_URL,
+    ):
+        """
+        `transport` is any object with a `request(method, url, **kwargs)`
+        method returning a response with `status_code`, `text` and `json()`,
+        e.g. `ReplayTransport`. By default requests go straight to AdsPower.
+
+        `recorder` is an optional `Recorder` that logs every request/response
+        pair, `request_delay` is the minimum pause in seconds between two
+        requests and `timeout` caps a single request. Use
+        `adspower.deadline.deadline` to cap a whole operation. `base_url`
+        points the client at another AdsPower API address.
+        """
+        self.base_url = base_url
         self.group_url = f"{self.base_url}/group"
         self.browser_url = f"{self.base_url}/browser"
         self.profile_url = f"{self.base_url}/user"
@@ -32,30 +77,80 @@ class AdsPower:
         self.profiles = None
         self.groups = None
 
-    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
-        resp = requests.request(method, url, **kwargs)
-        time.sleep(1)
+        self.transport = transport
+        self.recorder = recorder
+        self.request_delay = request_delay
+        self.timeout = timeout
 
-        json = resp.json()
-        if json["code"] != 0:
-            message = json["msg"].lower()
-            if "many" in message:
-                raise TooManyRequests()
+        self._next_request_at = 0.0
+        self._rate_lock = threading.Lock()
 
-            if "proxy fail" in message:
-                raise UnableToSetProxy()
+    @staticmethod
+    def _http_request(method: str, url: str, **kwargs) -> requests.Response:
+        import requests
 
-            if "accounts exceeds" in message:
-                raise ProfileLimitReached()
+        from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+        try:
+            resp = requests.request(method, url, stream=True, **kwargs)
+            with resp:
+                resp._content = _read_body(resp.raw)
+            return resp
+        except (requests.Timeout, ReadTimeoutError) as e:
+            raise OperationTimeout() from e
+        except requests.ConnectionError as e:
+            # A timeout while reading the body is wrapped as ConnectionError.
+            if e.args and isinstance(e.args[0], ReadTimeoutError):
+                raise OperationTimeout() from e
+            raise UnableToConnect(str(e)) from e
+        except ProtocolError as e:
+            raise UnableToConnect(str(e)) from e
+
+    def _wait_for_slot(self, budget: Optional[float]):
+        with self._rate_lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_request_at)
+            wait = send_at - now
+
+            # No point in waiting for a slot the deadline won't let us use.
+            if budget is not None and wait >= budget:
+                raise OperationTimeout()
+
+            self._next_request_at = send_at + self.request_delay
+
+        if wait > 0:
+            time.sleep(wait)
 
-            if "account does not exist" in message:
-                raise UnableToStartBrowser()
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        self._wait_for_slot(remaining())
 
-            if "is not open" in message:
-                raise UnableToStopBrowser()
+        budget = remaining()
+        if budget is not None:
+            kwargs["timeout"] = min(self.timeout, budget)
+        else:
+            kwargs["timeout"] = self.timeout
 
-            raise UnexpectedError(json)
+        started = time.monotonic()
+        try:
+            if self.transport is not None:
+                resp = self.transport.request(method, url, **kwargs)
+            else:
+                resp = self._http_request(method, url, **kwargs)
+        except Exception as e:
+            if self.recorder is not None:
+                elapsed = time.monotonic() - started
+                self.recorder.record(
+                    method, url, kwargs.get("json"), None, None, elapsed, error=e
+                )
+            raise
+        elapsed = time.monotonic() - started
+
+        if self.recorder is not None:
+            self.recorder.record(
+                method, url, kwargs.get("json"), resp.status_code, resp.text, elapsed
+            )
 
+        raise_for_response(resp.json())
         return resp
 
     def create_profile(
@@ -273,10 +368,10 @@ class AdsPower:
             payload["sys_app_cate_id"] = sys_app_cate_id
 
         if user_proxy_config != None:
-            payload["user_proxy_config"] = user_proxy_config.json()
+            payload["user_proxy_config"] = user_proxy_config.to_json()
 
         if fingerprint_config != None:
-            payload["fingerprint_config"] = fingerprint_config.json()
+            payload["fingerprint_config"] = fingerprint_config.to_json()
 
         self._request("POST", url, json=payload)
         return True
@@ -341,6 +436,8 @@ class AdsPower:
         resp = self._request("GET", url)
         json = resp.json()
 
+        from .models import Browser
+
         return Browser(json)
 
     def start_browser(self, user_id: str, ip_tab: str = "") -> Browser:
@@ -357,7 +454,9 @@ class AdsPower:
         resp = self._request("GET", url)
         json = resp.json()
 
-        return Browser.from_json(json) 
+        from .models import Browser
+
+        return Browser.from_json(json)
 
     def stop_browser(self, user_id: str) -> bool:
         """
@@ -407,6 +506,8 @@ class AdsPower:
         if len(data["list"]) == 0:
             return None
 
+        from .models import ProfileInfo
+
         raw_profiles = json["data"]["list"]
         profiles = {}
         for raw_profile in raw_profiles:
@@ -417,11 +518,40 @@ class AdsPower:
         self.profiles = profiles
         return profiles
 
+    def query_all_profiles_info(
+        self, group_id: str = "", page_size: int = 100
+    ) -> Dict[str, ProfileInfo]:
+        """
+        Pages through every profile, keyed by user_id since profile names
+        are not unique. The result is not cached.
+        More info can be found via url:
+        https://localapi-doc-en.adspower.com/docs/u8m2Ie
+        """
+        from .models import ProfileInfo
+
+        profiles = {}
+        page = 1
+        while True:
+            url = f"{self.profile_url}/list?page={page}&page_size={page_size}"
+            if group_id != "":
+                url = f"{url}&group_id={group_id}"
+
+            resp = self._request("GET", url)
+            raw_profiles = resp.json()["data"]["list"]
+            for raw_profile in raw_profiles:
+                profile_info = ProfileInfo(raw_profile)
+                profiles[profile_info.user_id] = profile_info
+
+            if len(raw_profiles) < page_size:
+                return profiles
+
+            page += 1
+
     def query_profile_info_by_name(
         self, name: str, refresh: bool = False
     ) -> ProfileInfo | None:
         profiles = self.query_profiles_info(refresh=refresh)
-        if not profile:
+        if not profiles:
             return None
         
         try:
@@ -451,6 +581,8 @@ class AdsPower:
         resp = self._request("GET", url)
         json = resp.json()
 
+        from .models import GroupInfo
+
         raw_groups = json["data"]["list"]
         groups = {}
         for raw_group in raw_groups:
@@ -1,3 +1,5 @@
+BASE_URL = "http://local.adspower.net:50325/api/v1"
+
 PROXY_SOFT_LUMINATI = "luminati"
 PROXY_SOFT_LUMAUTO = "lumauto"
 PROXY_SOFT_OXYLABSAUTO = "oxylabsatuto"
@@ -0,0 +1,49 @@
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from .errors import OperationTimeout
+
+_deadline: ContextVar[Optional[float]] = ContextVar("adspower_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """
+    Caps the total wall time of every AdsPower call made inside the block:
+
+        with deadline(10):
+            adspower.update_profile_by_name("MyProfile", remark="...")
+
+    Each request gets a timeout from the remaining budget and
+    `OperationTimeout` is raised once the budget is spent. Nested blocks
+    can only shorten the outer deadline, never extend it.
+    """
+    expires_at = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """
+    Seconds left until the current deadline, or None if no deadline is set.
+    Raises `OperationTimeout` if the deadline has already passed.
+    """
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+
+    left = expires_at - time.monotonic()
+    if left <= 0:
+        raise OperationTimeout()
+
+    return left
@@ -18,9 +18,49 @@ class UnableToSetProxy(Exception):
     pass
 
 
+class UnableToConnect(ConnectionError):
+    pass
+
+
 class UnexpectedError(Exception):
     def __init__(self, json):
         self.json = json
 
     def __repr__(self):
         return self.json
+
+
+class NoRecordedResponse(Exception):
+    def __init__(self, method, url):
+        self.method = method
+        self.url = url
+
+    def __str__(self):
+        return f"no recorded response left for {self.method} {self.url}"
+
+
+class OperationTimeout(Exception):
+    pass
+
+
+def raise_for_response(json):
+    if json["code"] == 0:
+        return
+
+    message = json["msg"].lower()
+    if "many" in message:
+        raise TooManyRequests()
+
+    if "proxy fail" in message:
+        raise UnableToSetProxy()
+
+    if "accounts exceeds" in message:
+        raise ProfileLimitReached()
+
+    if "account does not exist" in message:
+        raise UnableToStartBrowser()
+
+    if "is not open" in message:
+        raise UnableToStopBrowser()
+
+    raise UnexpectedError(json)
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from urllib.parse import urlparse
 
+from .consts import PROXY_SOFT_OTHER
+
 
 @dataclass
 class ProfileInfo:
@@ -105,9 +107,49 @@ class ProxyConfig:
         return ProxyConfig(soft="no_proxy")
 
     @classmethod
-    def from_string(cls, type: str, url: str):
+    def from_string(cls, type: str, url: str, soft: str = PROXY_SOFT_OTHER):
+        """
+        `type` overrides the proxy type taken from the url scheme,
+        see `parse` for the accepted url forms.
+        """
+        proxy = cls.parse(url, soft)
+        if type:
+            proxy.type = type
+
+        return proxy
+
+    @classmethod
+    def parse(cls, url: str, soft: str = PROXY_SOFT_OTHER):
+        """
+        Accepts either `type://[user:password@]host:port` or the common
+        `host:port[:user:password]` form, the latter defaults to http.
+        Raises `ValueError` if the url is neither.
+        """
+        if "://" not in url:
+            parts = url.split(":", 3)
+            if len(parts) not in (2, 4) or not parts[0] or not parts[1].isdigit():
+                raise ValueError(
+                    f"invalid proxy {url!r}, expected host:port[:user:password]"
+                )
+
+            host, port = parts[0], parts[1]
+            user, password = (parts[2], parts[3]) if len(parts) == 4 else ("", "")
+            return ProxyConfig(soft, "http", host, port, user, password)
+
         o = urlparse(url)
-        return ProxyConfig(type, o.scheme, o.hostname, o.port, o.username, o.password)
+        if not o.hostname or not o.port:
+            raise ValueError(
+                f"invalid proxy {url!r}, expected type://[user:password@]host:port"
+            )
+
+        return ProxyConfig(
+            soft,
+            o.scheme,
+            o.hostname,
+            str(o.port),
+            o.username or "",
+            o.password or "",
+        )
 
     @classmethod
     def from_json(cls, json: Dict):
@@ -121,6 +163,9 @@ class ProxyConfig:
             json.get("proxy_url", ""),
         )
 
+    def key(self) -> Tuple[str, str, str, str, str]:
+        return (self.type, self.host, str(self.port), self.user, self.password)
+
     def to_json(self) -> Dict:
         json = {"proxy_soft": self.soft}
         if self.soft == "no_proxy":
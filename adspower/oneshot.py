@@ -0,0 +1,76 @@
+"""
+Minimal browser start/stop for short-lived workers.
+
+Uses only the standard library and skips the models, so a process that
+just needs to start or stop one browser does not pay for importing
+`requests`. For anything else use `AdsPower`.
+"""
+
+import json
+
+from http.client import HTTPConnection
+from urllib.parse import urlencode, urlsplit
+from typing import Dict
+
+from .consts import BASE_URL
+from .deadline import remaining
+from .errors import OperationTimeout, raise_for_response
+
+
+def _get(path: str, params: Dict, base_url: str, timeout: float) -> Dict:
+    # http.client is used directly, urllib.request costs twice the import time.
+    url = urlsplit(f"{base_url}{path}?{urlencode(params)}")
+
+    budget = remaining()
+    if budget is not None:
+        timeout = min(timeout, budget)
+
+    conn = HTTPConnection(url.hostname, url.port or 80, timeout=timeout)
+    try:
+        conn.request("GET", f"{url.path}?{url.query}")
+        resp = conn.getresponse()
+
+        # The timeout only bounds each socket operation, so the body is read
+        # in chunks and the deadline is checked before waiting for more of
+        # it. A body which has fully arrived is never discarded.
+        chunks = []
+        while not resp.isclosed():
+            remaining()
+            chunk = resp.read1(16384)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except TimeoutError as e:
+        raise OperationTimeout() from e
+    finally:
+        conn.close()
+
+    body = json.loads(b"".join(chunks))
+
+    raise_for_response(body)
+    return body
+
+
+def start_browser(
+    user_id: str, ip_tab: str = "", base_url: str = BASE_URL, timeout: float = 30
+) -> Dict:
+    """
+    Returns the `data` of the response. If a model is needed, wrap it
+    back up: `Browser.from_json({"data": data})`.
+    More info can be found via url:
+    https://localapi-doc-en.adspower.com/docs/FFMFMf
+    """
+    params = {"user_id": user_id}
+    if ip_tab != "":
+        params["ip_tab"] = ip_tab
+
+    return _get("/browser/start", params, base_url, timeout)["data"]
+
+
+def stop_browser(user_id: str, base_url: str = BASE_URL, timeout: float = 30) -> bool:
+    """
+    More info can be found via url:
+    https://localapi-doc-en.adspower.com/docs/DXam94
+    """
+    _get("/browser/stop", {"user_id": user_id}, base_url, timeout)
+    return True
@@ -0,0 +1,201 @@
+import socket
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .consts import PROXY_SOFT_OTHER
+from .models import ProfileInfo, ProxyConfig
+
+ProxyKey = Tuple[str, str, str, str, str]
+
+
+def check_proxy(proxy: ProxyConfig, timeout: float = 3) -> bool:
+    """
+    Checks a proxy from this machine only: opens a TCP connection and, for
+    socks5 proxies, performs the greeting handshake. No traffic goes past
+    the proxy itself.
+    """
+    try:
+        address = (proxy.host, int(proxy.port))
+        with socket.create_connection(address, timeout) as sock:
+            if proxy.type.startswith("socks5"):
+                # version 5, one auth method offered: "no auth" or user/password
+                method = b"\x02" if proxy.user else b"\x00"
+                sock.sendall(b"\x05\x01" + method)
+                reply = sock.recv(2)
+                return reply == b"\x05" + method
+
+            return True
+    except (OSError, ValueError):
+        return False
+
+
+class ProxyPool:
+    """
+    Keeps a set of proxies together with their health and the profiles
+    using each of them, so dead proxies can be rotated out in one pass:
+
+        pool = ProxyPool.from_file("proxies.txt")
+        pool.load_profiles(adspower.query_all_profiles_info())
+        pool.check()
+        applied, failed = pool.rotate(adspower)
+    """
+
+    proxies: Dict[ProxyKey, ProxyConfig]
+    alive: Dict[ProxyKey, bool]
+    usage: Dict[ProxyKey, Set[str]]
+    assignments: Dict[str, ProxyKey]
+
+    def __init__(self, proxies: Iterable[ProxyConfig]):
+        self.proxies = {}
+        self.alive = {}
+        self.usage = {}
+        self.assignments = {}
+
+        for proxy in proxies:
+            self.add(proxy)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], soft: str = PROXY_SOFT_OTHER):
+        """
+        Raises `ValueError` naming the first line which is not a proxy.
+        """
+        proxies = []
+        for number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+
+            try:
+                proxies.append(ProxyConfig.parse(line, soft))
+            except ValueError as e:
+                raise ValueError(f"line {number}: {e}") from e
+
+        return ProxyPool(proxies)
+
+    @classmethod
+    def from_file(cls, path: str, soft: str = PROXY_SOFT_OTHER):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_lines(f, soft)
+
+    def add(self, proxy: ProxyConfig):
+        key = proxy.key()
+        if key in self.proxies:
+            return
+
+        self.proxies[key] = proxy
+        self.usage[key] = set()
+
+    def check(self, timeout: float = 3, workers: int = 64) -> Dict[ProxyKey, bool]:
+        keys = list(self.proxies)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                lambda key: check_proxy(self.proxies[key], timeout), keys
+            )
+            self.alive.update(zip(keys, results))
+
+        return self.alive
+
+    def is_alive(self, key: ProxyKey) -> bool:
+        # Proxies which were never checked are assumed to work.
+        return self.alive.get(key, True)
+
+    def dead(self) -> List[ProxyConfig]:
+        return [proxy for key, proxy in self.proxies.items() if not self.is_alive(key)]
+
+    def load_profiles(self, profiles: Optional[Dict[str, ProfileInfo]]):
+        """
+        Picks up which proxy every profile currently uses, as returned by
+        `AdsPower.query_all_profiles_info`. Profiles using a proxy outside
+        of the pool are ignored.
+        """
+        for profile in (profiles or {}).values():
+            raw_proxy = getattr(profile, "user_proxy_config", None)
+            if not raw_proxy:
+                continue
+
+            key = ProxyConfig.from_json(raw_proxy).key()
+            if key in self.proxies:
+                self._assign(profile.user_id, key)
+
+    def acquire(self, user_id: str) -> ProxyConfig | None:
+        """
+        Assigns the least used alive proxy to the profile.
+        """
+        key = self._least_used(exclude=self.assignments.get(user_id))
+        if key is None:
+            return None
+
+        self._assign(user_id, key)
+        return self.proxies[key]
+
+    def release(self, user_id: str):
+        key = self.assignments.pop(user_id, None)
+        if key is not None:
+            self.usage[key].discard(user_id)
+
+    def rotation_plan(self) -> Dict[str, ProxyConfig]:
+        """
+        Maps every profile sitting on a dead proxy to its replacement.
+        Profiles on alive proxies are left out, so applying the plan only
+        touches what actually has to change.
+        """
+        planned: Dict[ProxyKey, int] = {}
+        plan = {}
+        for user_id, key in self.assignments.items():
+            if self.is_alive(key):
+                continue
+
+            new_key = self._least_used(planned=planned)
+            if new_key is None:
+                break
+
+            planned[new_key] = planned.get(new_key, 0) + 1
+            plan[user_id] = self.proxies[new_key]
+
+        return plan
+
+    def rotate(
+        self, adspower
+    ) -> Tuple[Dict[str, ProxyConfig], Dict[str, Exception]]:
+        """
+        Moves every profile off dead proxies with one `update_profile` call
+        per affected profile. A failed call does not stop the rotation,
+        returns the applied changes and the errors of failed ones, both
+        keyed by user_id. Failed profiles stay on their dead proxy, so
+        calling `rotate` again retries them.
+        """
+        applied = {}
+        failed = {}
+        for user_id, proxy in self.rotation_plan().items():
+            try:
+                adspower.update_profile(user_id, user_proxy_config=proxy)
+            except Exception as e:
+                failed[user_id] = e
+                continue
+
+            self._assign(user_id, proxy.key())
+            applied[user_id] = proxy
+
+        return applied, failed
+
+    def _assign(self, user_id: str, key: ProxyKey):
+        self.release(user_id)
+        self.assignments[user_id] = key
+        self.usage[key].add(user_id)
+
+    def _least_used(
+        self,
+        exclude: Optional[ProxyKey] = None,
+        planned: Optional[Dict[ProxyKey, int]] = None,
+    ) -> ProxyKey | None:
+        planned = planned or {}
+        candidates = [
+            key for key in self.proxies if key != exclude and self.is_alive(key)
+        ]
+        if not candidates:
+            return None
+
+        return min(
+            candidates, key=lambda key: len(self.usage[key]) + planned.get(key, 0)
+        )
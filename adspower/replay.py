@@ -0,0 +1,215 @@
+import json
+import threading
+import time
+import uuid
+
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from .errors import NoRecordedResponse, OperationTimeout, UnableToConnect
+
+
+class RecordedResponse:
+    """
+    Minimal stand-in for `requests.Response` built from a recorded entry.
+    Body is kept as raw text so `json()` pays the same parsing cost as a
+    live response does.
+    """
+
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+
+    def json(self) -> Dict:
+        return json.loads(self.text)
+
+
+# Fields holding credentials, masked in recordings unless asked otherwise.
+SECRET_FIELDS = {"password", "proxy_password", "cookie", "fakey"}
+MASK = "***"
+
+
+def _mask(value):
+    if isinstance(value, dict):
+        return {
+            key: MASK if key in SECRET_FIELDS and val else _mask(val)
+            for key, val in value.items()
+        }
+
+    if isinstance(value, list):
+        return [_mask(val) for val in value]
+
+    return value
+
+
+class Recorder:
+    """
+    Appends every request/response pair made by `AdsPower._request` to a
+    JSON Lines file, one compact entry per line:
+
+        {"run": ..., "ts": ..., "method": ..., "url": ..., "payload": ...,
+         "elapsed": ..., "status": ..., "body": ...}
+
+    `run` identifies the `Recorder` which wrote the entry and `ts` is the
+    wall time the request was sent at. A request which raised
+    instead of returning a response is stored with an `error` field in
+    place of `status` and `body`.
+
+    Passwords, cookies and 2FA keys (see `SECRET_FIELDS`) are masked in
+    payloads and bodies. Pass `mask_secrets=False` to record them as is,
+    the file is then as sensitive as the AdsPower profiles themselves.
+
+    The file is opened in append mode, so several runs can share it.
+    """
+
+    def __init__(self, path: str, mask_secrets: bool = True):
+        self.path = path
+        self.mask_secrets = mask_secrets
+        self.run = uuid.uuid4().hex[:12]
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict],
+        status: Optional[int],
+        body: Optional[str],
+        elapsed: float,
+        error: Optional[Exception] = None,
+    ):
+        if self.mask_secrets:
+            payload = _mask(payload)
+            body = self._mask_body(body)
+
+        entry = {
+            "run": self.run,
+            "ts": round(time.time() - elapsed, 6),
+            "method": method,
+            "url": url,
+            "payload": payload,
+            "elapsed": round(elapsed, 6),
+        }
+        if error is not None:
+            entry["error"] = {"type": type(error).__name__, "message": str(error)}
+        else:
+            entry["status"] = status
+            entry["body"] = body
+
+        line = json.dumps(entry, separators=(",", ":"), ensure_ascii=False)
+
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    @staticmethod
+    def _mask_body(body: Optional[str]) -> Optional[str]:
+        if not body:
+            return body
+
+        try:
+            parsed = json.loads(body)
+        except ValueError:
+            return body
+
+        # Keep the body byte for byte unless a secret had to be masked.
+        masked = _mask(parsed)
+        if masked == parsed:
+            return body
+
+        return json.dumps(masked, separators=(",", ":"), ensure_ascii=False)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ReplayTransport:
+    """
+    Serves responses from a file written by `Recorder` instead of talking
+    to the AdsPower app. Responses are matched by method and url and
+    handed out in the order they were recorded.
+
+    With `realtime=True` requests are paced by the recorded gaps between
+    requests of the same run and every response is delayed by its recorded
+    duration, otherwise responses are returned as fast as possible. There
+    is no pause between the last request of one run and the next run. Pass `request_delay=0` to `AdsPower`
+    as well to skip the client-side pause between requests when profiling.
+    A realtime response slower than the request timeout raises
+    `OperationTimeout`, as a live one would.
+
+    Recorded failures are raised again: `OperationTimeout` for timeouts and
+    `UnableToConnect` carrying the recorded message for anything else, the
+    same errors `AdsPower` raises on live traffic.
+    """
+
+    def __init__(self, path: str, realtime: bool = False):
+        self.path = path
+        self.realtime = realtime
+
+        self._entries: Dict[Tuple[str, str], Deque[Dict]] = {}
+        self._lock = threading.Lock()
+        # The last entry served and the monotonic time it was served at.
+        self._previous: Optional[Dict] = None
+        self._previous_at = 0.0
+
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+
+                entry = json.loads(line)
+                key = (entry["method"].upper(), entry["url"])
+                self._entries.setdefault(key, deque()).append(entry)
+
+    def request(self, method: str, url: str, **kwargs) -> RecordedResponse:
+        key = (method.upper(), url)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise NoRecordedResponse(method, url)
+
+            entry = entries.popleft()
+            wait = self._gap(entry) if self.realtime else 0
+            self._previous = entry
+            self._previous_at = time.monotonic() + wait
+
+        if self.realtime:
+            if wait > 0:
+                time.sleep(wait)
+
+            timeout = kwargs.get("timeout")
+            if timeout is not None and entry["elapsed"] > timeout:
+                time.sleep(timeout)
+                raise OperationTimeout()
+
+            time.sleep(entry["elapsed"])
+
+        error = entry.get("error")
+        if error is not None:
+            if error["type"] == OperationTimeout.__name__:
+                raise OperationTimeout()
+
+            raise UnableToConnect(f"{error['type']}: {error['message']}")
+
+        return RecordedResponse(entry["status"], entry["body"])
+
+    def _gap(self, entry: Dict) -> float:
+        previous = self._previous
+        if previous is None or previous.get("run") != entry.get("run"):
+            return 0
+
+        recorded = entry["ts"] - previous["ts"]
+        return max(0, recorded - (time.monotonic() - self._previous_at))
+
+    def remaining(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._entries.values())
@@ -0,0 +1,150 @@
+"""
+Startup benchmark for short-lived workers.
+
+Measures, each in a fresh interpreter, the import cost of the package and
+of the `AdsPower` client, and the latency of a first `stop_browser` call
+from process start, both through `adspower.oneshot` and through
+`AdsPower`. Calls go to a stub AdsPower API served from this process, so
+no AdsPower app is needed.
+
+Absolute timings depend on the machine, so every budget is a multiple of
+a reference measured in the same run: a first stdlib-only HTTP call
+(`http.client` and `json`) to the same stub. Exits with status 1 if a
+median exceeds its budget, or if an import pulls in `requests` or the
+models ahead of the first call:
+
+    python benchmarks/startup.py --runs 15 --client-call-budget 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Each snippet prints its elapsed time and the eagerly imported modules.
+SNIPPET = """
+import sys, time
+started = time.perf_counter()
+%s
+elapsed = time.perf_counter() - started
+eager = [name for name in ("requests", "adspower.models") if name in sys.modules]
+print(elapsed, ",".join(eager))
+"""
+
+REFERENCE = (
+    "import http.client, json\n"
+    "conn = http.client.HTTPConnection({host!r}, {port})\n"
+    "conn.request('GET', '/api/v1/browser/stop?user_id=benchmark')\n"
+    "json.loads(conn.getresponse().read())"
+)
+
+# name, budget option, code, default budget as a multiple of the reference,
+# whether eager imports fail
+BENCHMARKS = [
+    ("import adspower", "import", "import adspower", 0.15, True),
+    (
+        "from adspower import AdsPower",
+        "client-import",
+        "from adspower import AdsPower",
+        0.5,
+        True,
+    ),
+    (
+        "first oneshot.stop_browser call",
+        "oneshot-call",
+        "from adspower.oneshot import stop_browser\n"
+        "stop_browser('benchmark', base_url={base_url!r})",
+        1.5,
+        False,
+    ),
+    (
+        "first AdsPower.stop_browser call",
+        "client-call",
+        "from adspower import AdsPower\n"
+        "AdsPower(base_url={base_url!r}, request_delay=0).stop_browser('benchmark')",
+        5,
+        False,
+    ),
+]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = json.dumps({"code": 0, "msg": "success"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def run(code: str) -> str:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    resp = subprocess.run(
+        [sys.executable, "-c", SNIPPET % code],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if resp.returncode != 0:
+        sys.exit(resp.stderr)
+
+    return resp.stdout.strip()
+
+
+def measure(code: str, runs: int, lazy: bool) -> float:
+    times = []
+    for _ in range(runs):
+        elapsed, eager = run(code).partition(" ")[::2]
+        if lazy and eager:
+            sys.exit(f"`{code}` eagerly imported: {eager}")
+
+        times.append(float(elapsed) * 1000)
+
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=15)
+    for _, option, _, budget, _ in BENCHMARKS:
+        parser.add_argument(f"--{option}-budget", type=float, default=budget)
+    args = parser.parse_args()
+
+    server = HTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    base_url = f"http://{host}:{port}/api/v1"
+
+    reference = measure(REFERENCE.format(host=host, port=port), args.runs, False)
+    print(f"reference stdlib call: {reference:.1f} ms median")
+
+    failed = False
+    for name, option, code, _, lazy in BENCHMARKS:
+        budget = getattr(args, f"{option.replace('-', '_')}_budget")
+        median = measure(code.format(base_url=base_url), args.runs, lazy)
+        ratio = median / reference
+
+        status = "ok" if ratio <= budget else "OVER BUDGET"
+        print(
+            f"{name}: {median:.1f} ms median, {ratio:.2f}x reference "
+            f"(budget {budget:.2f}x) {status}"
+        )
+        failed = failed or ratio > budget
+
+    server.shutdown()
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
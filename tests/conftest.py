@@ -0,0 +1,82 @@
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubAdsPower:
+    """
+    Local stand-in for the AdsPower API. `routes` maps a path such as
+    `/browser/stop` to the JSON body to answer with, `delays` optionally
+    holds seconds to wait before answering and `drips` seconds to wait
+    between every byte of the body.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.delays = {}
+        self.drips = {}
+        self.requests = []
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._answer()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                self._answer()
+
+            def _answer(self):
+                path = self.path.split("?")[0].removeprefix("/api/v1")
+                stub.requests.append((self.command, self.path))
+
+                body = json.dumps(
+                    stub.routes.get(path, {"code": -1, "msg": "unknown route"})
+                ).encode()
+                time.sleep(stub.delays.get(path, 0))
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+
+                drip = stub.drips.get(path)
+                try:
+                    if drip is None:
+                        self.wfile.write(body)
+                        return
+
+                    for i in range(len(body)):
+                        self.wfile.write(body[i : i + 1])
+                        self.wfile.flush()
+                        time.sleep(drip)
+                except OSError:
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}/api/v1"
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    stub = StubAdsPower()
+    stub.start()
+    yield stub
+    stub.stop()
@@ -0,0 +1,132 @@
+import json
+import socket
+import time
+
+import pytest
+
+from adspower.deadline import deadline, remaining
+from adspower.errors import OperationTimeout, UnableToConnect
+from adspower.replay import RecordedResponse
+
+OK = {"code": 0, "msg": "success"}
+
+
+def test_deadline_nesting():
+    assert remaining() is None
+
+    with deadline(10):
+        with deadline(60):
+            assert remaining() <= 10
+
+        with deadline(0.05):
+            assert remaining() <= 0.05
+            time.sleep(0.06)
+            with pytest.raises(OperationTimeout):
+                remaining()
+
+        assert 9 < remaining() <= 10
+
+    assert remaining() is None
+
+
+def test_oneshot_bounds_slow_body(stub):
+    from adspower.oneshot import stop_browser
+
+    stub.routes["/browser/stop"] = OK
+    stub.drips["/browser/stop"] = 0.05
+
+    started = time.monotonic()
+    with pytest.raises(OperationTimeout):
+        with deadline(0.3):
+            stop_browser("u1", base_url=stub.base_url)
+
+    assert time.monotonic() - started < 0.6
+
+
+class SlowTransport:
+    def __init__(self, delay, body):
+        self.delay = delay
+        self.body = body
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        return RecordedResponse(200, json.dumps(self.body))
+
+
+class ProxyConfigStub:
+    def to_json(self):
+        return {}
+
+
+def test_completed_response_is_not_discarded():
+    from adspower import AdsPower
+
+    transport = SlowTransport(0.2, {"code": 0, "msg": "", "data": {"id": "u1"}})
+    client = AdsPower(transport=transport, request_delay=0)
+
+    with deadline(0.1):
+        user_id = client.create_profile(
+            "g1", ProxyConfigStub(), ProxyConfigStub(), name="p1"
+        )
+
+    assert user_id == "u1"
+
+
+def test_rate_limit_wait_fails_fast():
+    from adspower import AdsPower
+
+    transport = SlowTransport(0, OK)
+    client = AdsPower(transport=transport, request_delay=1)
+    client.stop_browser("u1")
+
+    started = time.monotonic()
+    with pytest.raises(OperationTimeout):
+        with deadline(0.5):
+            client.stop_browser("u1")
+
+    assert time.monotonic() - started < 0.1
+    assert transport.calls == 1
+
+
+class TestHttpRequest:
+    @pytest.fixture(autouse=True)
+    def _requests(self):
+        pytest.importorskip("requests")
+
+    def client(self, base_url, **kwargs):
+        from adspower import AdsPower
+
+        return AdsPower(base_url=base_url, request_delay=0, **kwargs)
+
+    def test_slow_answer_times_out(self, stub):
+        stub.routes["/browser/stop"] = OK
+        stub.delays["/browser/stop"] = 0.5
+
+        with pytest.raises(OperationTimeout):
+            self.client(stub.base_url, timeout=0.1).stop_browser("u1")
+
+    def test_slow_body_times_out_within_deadline(self, stub):
+        stub.routes["/browser/stop"] = OK
+        stub.drips["/browser/stop"] = 0.05
+
+        started = time.monotonic()
+        with pytest.raises(OperationTimeout):
+            with deadline(0.3):
+                self.client(stub.base_url).stop_browser("u1")
+
+        assert time.monotonic() - started < 0.6
+
+    def test_refused_connection(self):
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sock.close()
+
+        with pytest.raises(UnableToConnect):
+            self.client(f"http://127.0.0.1:{port}/api/v1").stop_browser("u1")
+
+    def test_ok(self, stub):
+        stub.routes["/browser/stop"] = OK
+        assert self.client(stub.base_url).stop_browser("u1")
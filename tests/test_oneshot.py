@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import adspower
+from adspower.errors import TooManyRequests, UnableToStopBrowser
+from adspower.oneshot import start_browser, stop_browser
+
+BROWSER = {
+    "code": 0,
+    "msg": "success",
+    "data": {
+        "ws": {"selenium": "127.0.0.1:9222", "puppeteer": "ws://127.0.0.1:9222"},
+        "webdriver": "/path/to/chromedriver",
+    },
+}
+
+
+def test_start_browser(stub):
+    stub.routes["/browser/start"] = BROWSER
+
+    data = start_browser("u1", ip_tab="0", base_url=stub.base_url)
+
+    assert data == BROWSER["data"]
+    assert stub.requests == [("GET", "/api/v1/browser/start?user_id=u1&ip_tab=0")]
+
+    from adspower.models import Browser
+
+    browser = Browser.from_json({"data": data})
+    assert browser.cdp_wss == "ws://127.0.0.1:9222"
+
+
+def test_stop_browser(stub):
+    stub.routes["/browser/stop"] = {"code": 0, "msg": "success"}
+    assert stop_browser("u1", base_url=stub.base_url)
+
+
+@pytest.mark.parametrize(
+    "msg, error",
+    [
+        ("Browser is not open", UnableToStopBrowser),
+        ("Too many request", TooManyRequests),
+    ],
+)
+def test_stop_browser_errors(stub, msg, error):
+    stub.routes["/browser/stop"] = {"code": -1, "msg": msg}
+    with pytest.raises(error):
+        stop_browser("u1", base_url=stub.base_url)
+
+
+def test_lazy_attributes():
+    from adspower.adspower import AdsPower
+    from adspower.models import ProxyConfig
+
+    assert adspower.AdsPower is AdsPower
+    assert adspower.ProxyConfig is ProxyConfig
+    assert adspower.TooManyRequests is TooManyRequests
+
+    with pytest.raises(AttributeError):
+        adspower.DoesNotExist
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, adspower\n"
+        "from adspower import AdsPower\n"
+        "from adspower.oneshot import stop_browser\n"
+        "print(','.join(m for m in ('requests', 'adspower.models') if m in sys.modules))"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    resp = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert resp.stdout.strip() == ""
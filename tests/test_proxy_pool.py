@@ -0,0 +1,162 @@
+import socket
+import threading
+
+import pytest
+
+from adspower.errors import TooManyRequests
+from adspower.models import ProfileInfo, ProxyConfig
+from adspower.proxy_pool import ProxyPool, check_proxy
+
+
+def listen(reply: bytes = b""):
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+
+    def serve():
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+
+            with conn:
+                if reply:
+                    conn.recv(3)
+                    conn.sendall(reply)
+
+    threading.Thread(target=serve, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def live_port():
+    server = listen()
+    yield server.getsockname()[1]
+    server.close()
+
+
+@pytest.fixture
+def closed_port():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def profile(user_id: str, port: int) -> ProfileInfo:
+    return ProfileInfo(
+        {
+            "name": user_id,
+            "user_id": user_id,
+            "user_proxy_config": {
+                "proxy_soft": "other",
+                "proxy_type": "http",
+                "proxy_host": "127.0.0.1",
+                "proxy_port": str(port),
+                "proxy_user": "",
+                "proxy_password": "",
+            },
+        }
+    )
+
+
+class StubClient:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.updates = {}
+
+    def update_profile(self, user_id, user_proxy_config):
+        if user_id in self.failing:
+            raise TooManyRequests()
+
+        self.updates[user_id] = user_proxy_config
+
+
+def test_from_lines():
+    pool = ProxyPool.from_lines(
+        [
+            "# comment",
+            "",
+            "1.2.3.4:8080",
+            "1.2.3.4:8080",
+            "5.6.7.8:1080:user:pa:ss",
+            "socks5://u:p@9.9.9.9:1080",
+        ]
+    )
+
+    assert [proxy.key() for proxy in pool.proxies.values()] == [
+        ("http", "1.2.3.4", "8080", "", ""),
+        ("http", "5.6.7.8", "1080", "user", "pa:ss"),
+        ("socks5", "9.9.9.9", "1080", "u", "p"),
+    ]
+
+
+@pytest.mark.parametrize("line", ["1.2.3.4", "1.2.3.4:8080:user", "http://1.2.3.4"])
+def test_from_lines_names_bad_line(line):
+    with pytest.raises(ValueError, match="line 2"):
+        ProxyPool.from_lines(["1.2.3.4:8080", line])
+
+
+def test_from_string_keeps_argument_order():
+    proxy = ProxyConfig.from_string("socks5", "socks5://h:1")
+    assert proxy.soft == "other"
+    assert proxy.key() == ("socks5", "h", "1", "", "")
+
+
+def test_check_proxy(live_port, closed_port):
+    assert check_proxy(ProxyConfig.parse(f"127.0.0.1:{live_port}"), timeout=1)
+    assert not check_proxy(ProxyConfig.parse(f"127.0.0.1:{closed_port}"), timeout=1)
+
+
+def test_check_proxy_socks5_handshake():
+    accepting = listen(reply=b"\x05\x00")
+    wrong_method = listen(reply=b"\x05\x02")
+    try:
+        port = accepting.getsockname()[1]
+        assert check_proxy(ProxyConfig.parse(f"socks5://127.0.0.1:{port}"), timeout=1)
+
+        port = wrong_method.getsockname()[1]
+        assert not check_proxy(
+            ProxyConfig.parse(f"socks5://127.0.0.1:{port}"), timeout=1
+        )
+    finally:
+        accepting.close()
+        wrong_method.close()
+
+
+def test_rotation_plan(live_port, closed_port):
+    pool = ProxyPool.from_lines(
+        [f"127.0.0.1:{live_port}", f"127.0.0.1:{closed_port}"]
+    )
+    pool.load_profiles(
+        {
+            "u1": profile("u1", closed_port),
+            "u2": profile("u2", closed_port),
+            "u3": profile("u3", live_port),
+        }
+    )
+    pool.check(timeout=1)
+
+    plan = pool.rotation_plan()
+
+    assert sorted(plan) == ["u1", "u2"]
+    assert all(proxy.port == str(live_port) for proxy in plan.values())
+
+
+def test_rotate_collects_failures(live_port, closed_port):
+    pool = ProxyPool.from_lines(
+        [f"127.0.0.1:{live_port}", f"127.0.0.1:{closed_port}"]
+    )
+    pool.load_profiles(
+        {"u1": profile("u1", closed_port), "u2": profile("u2", closed_port)}
+    )
+    pool.check(timeout=1)
+    client = StubClient(failing=["u1"])
+
+    applied, failed = pool.rotate(client)
+
+    assert list(applied) == ["u2"] == list(client.updates)
+    assert isinstance(failed["u1"], TooManyRequests)
+    assert list(pool.rotation_plan()) == ["u1"]
@@ -0,0 +1,141 @@
+import json
+import socket
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+
+from adspower import AdsPower
+from adspower.errors import OperationTimeout, UnableToConnect
+from adspower.replay import Recorder, ReplayTransport
+
+PROFILES = {
+    "code": 0,
+    "msg": "success",
+    "data": {
+        "list": [
+            {
+                "name": "p1",
+                "user_id": "u1",
+                "password": "secret",
+                "user_proxy_config": {"proxy_host": "h", "proxy_password": "pw"},
+            }
+        ]
+    },
+}
+
+
+def read_entries(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def closed_base_url():
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return f"http://127.0.0.1:{port}/api/v1"
+
+
+def test_round_trip_masks_secrets(stub, tmp_path):
+    stub.routes["/user/list"] = PROFILES
+    stub.routes["/user/update"] = {"code": 0, "msg": "success"}
+    path = tmp_path / "traffic.jsonl"
+
+    with Recorder(path) as recorder:
+        client = AdsPower(base_url=stub.base_url, recorder=recorder, request_delay=0)
+        client.query_profiles_info(refresh=True)
+        client.update_profile("u1", password="new-secret")
+
+    text = path.read_text()
+    assert "secret" not in text
+    assert "pw" not in text
+
+    entries = read_entries(path)
+    assert entries[1]["payload"] == {"user_id": "u1", "password": "***"}
+    # Bodies without secrets are kept exactly as received.
+    assert entries[1]["body"] == '{"code": 0, "msg": "success"}'
+    assert ", " not in entries[0]["body"]
+
+    replayed = AdsPower(
+        base_url=stub.base_url, transport=ReplayTransport(path), request_delay=0
+    )
+    profile = replayed.query_profiles_info(refresh=True)["p1"]
+    assert profile.user_id == "u1"
+    assert profile.password == "***"
+    assert replayed.update_profile("u1", password="new-secret")
+
+
+def test_recorded_failures_are_raised_again(tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    base_url = closed_base_url()
+
+    with Recorder(path) as recorder:
+        client = AdsPower(base_url=base_url, recorder=recorder, request_delay=0)
+        with pytest.raises(UnableToConnect):
+            client.stop_browser("u1")
+
+    assert "error" in read_entries(path)[0]
+
+    replayed = AdsPower(
+        base_url=base_url, transport=ReplayTransport(path), request_delay=0
+    )
+    with pytest.raises(UnableToConnect):
+        replayed.stop_browser("u1")
+
+
+def test_realtime_replay_times_out_like_live_traffic(stub, tmp_path):
+    stub.routes["/browser/stop"] = {"code": 0, "msg": "success"}
+    stub.delays["/browser/stop"] = 0.3
+    path = tmp_path / "traffic.jsonl"
+
+    with Recorder(path) as recorder:
+        client = AdsPower(base_url=stub.base_url, recorder=recorder, request_delay=0)
+        client.stop_browser("u1")
+
+    transport = ReplayTransport(path, realtime=True)
+    replayed = AdsPower(
+        base_url=stub.base_url, transport=transport, request_delay=0, timeout=0.1
+    )
+    with pytest.raises(OperationTimeout):
+        replayed.stop_browser("u1")
+
+
+def write_entries(path, entries):
+    with open(path, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def entry(run, ts, url):
+    return {
+        "run": run,
+        "ts": ts,
+        "method": "GET",
+        "url": url,
+        "payload": None,
+        "elapsed": 0,
+        "status": 200,
+        "body": '{"code":0}',
+    }
+
+
+def test_realtime_replay_paces_within_a_run_only(tmp_path):
+    path = tmp_path / "traffic.jsonl"
+    write_entries(
+        path,
+        [
+            entry("yesterday", 1000.0, "a"),
+            entry("yesterday", 1000.3, "b"),
+            entry("today", 87400.0, "c"),
+        ],
+    )
+    transport = ReplayTransport(path, realtime=True)
+
+    started = time.monotonic()
+    for url in ("a", "b", "c"):
+        transport.request("GET", url)
+
+    assert 0.3 <= time.monotonic() - started < 1